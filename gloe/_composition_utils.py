@@ -1,6 +1,6 @@
 import types
 from inspect import Signature
-from typing import TypeVar, Any, Optional, Union
+from typing import TypeVar, Any, Optional, Union, cast
 
 from gloe.async_transformer import AsyncTransformer
 from gloe.base_transformer import BaseTransformer
@@ -99,7 +99,7 @@ def _compose_serial(transformer1, _transformer2):
     new_transformer.__class__.__name__ = transformer2.__class__.__name__
     new_transformer._label = transformer2.label
     new_transformer._children = transformer2.children
-    new_transformer._plotting_settings = transformer2._plotting_settings
+    new_transformer._plotting_settings = transformer2.plotting_settings
     # new_transformer._set_previous(transformer2.previous)
     return new_transformer
 
@@ -167,22 +167,18 @@ def _compose_nodes(
     current: BaseTransformer,
     next_node: Union[tuple, BaseTransformer],
 ):
-    if issubclass(type(current), BaseTransformer):
-        if issubclass(type(next_node), BaseTransformer):
-            return _compose_serial(current, next_node)
-        elif type(next_node) is tuple:
-            is_all_base_transformers = all(
-                issubclass(type(next_transformer), BaseTransformer)
-                for next_transformer in next_node
-            )
-            if is_all_base_transformers:
-                return _compose_diverging(current, *next_node)
-
-            unsupported_elem = [
-                elem for elem in next_node if not isinstance(elem, BaseTransformer)
-            ]
-            raise UnsupportedTransformerArgException(unsupported_elem[0])
-        else:
-            raise UnsupportedTransformerArgException(next_node)
-    else:
+    if not isinstance(current, BaseTransformer):
         raise UnsupportedTransformerArgException(next_node)  # pragma: no cover
+
+    # the exact type check on tuples is much cheaper than an ABC instance check
+    is_serial = type(next_node) is not tuple
+    if not is_serial:
+        for next_transformer in cast(tuple, next_node):
+            if not isinstance(next_transformer, BaseTransformer):
+                raise UnsupportedTransformerArgException(next_transformer)
+    elif not isinstance(next_node, BaseTransformer):
+        raise UnsupportedTransformerArgException(next_node)
+
+    if is_serial:
+        return _compose_serial(current, next_node)
+    return _compose_diverging(current, *cast(tuple, next_node))
@@ -1,3 +1,4 @@
+from collections import deque
 from typing import Any
 
 
@@ -37,10 +38,10 @@ class GloeGraph:
             name=self.name, compound=True, directed=True, style="dotted", **self.attrs
         )
 
-        subgraphs_stack = [(self, self.subgraphs)]
+        subgraphs_stack = deque([(self, self.subgraphs)])
         sub_agraph = A
         while len(subgraphs_stack) > 0:
-            graph, subgraphs = subgraphs_stack.pop(0)
+            graph, subgraphs = subgraphs_stack.popleft()
             for subgraph in subgraphs:
                 sub_agraph = sub_agraph.add_subgraph(
                     name=subgraph.name, **subgraph.attrs
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Any
+from types import MappingProxyType
+from typing import Optional, Any, Mapping
 
 
 class NodeType(Enum):
@@ -18,37 +19,85 @@ class GatewaySettings:
     extra_labels: list[str] = field(default_factory=list)
 
 
-@dataclass
 class PlottingSettings:
-    node_type: NodeType
-    has_children: bool = False
-    invisible: bool = False
-    is_async: bool = False
-    is_gateway: bool = False
-    gateway_settings: Optional[GatewaySettings] = None
-    parent_id: Optional[str] = None
-
-
-def dot_props(node_type: NodeType) -> dict[str, Any]:
-    node_props: dict[str, Any] = {"shape": "box"}
-
-    if node_type == NodeType.ConditionBegin:
-        node_props = {"shape": "diamond", "style": "filled", "port": "n"}
-    elif node_type == NodeType.ConditionEnd:
-        node_props = {
-            "shape": "diamond",
-            "style": "filled",
-            "port": "n",
-            "width": 0.4,
-            "height": 0.4,
-        }
-    elif node_type == NodeType.ParallelGatewayBegin:
-        node_props = {"shape": "diamond", "width": 0.4, "height": 0.4, "label": ""}
-    elif node_type == NodeType.ParallelGatewayEnd:
-        node_props = {"shape": "diamond", "width": 0.4, "height": 0.4, "label": ""}
-    elif node_type == NodeType.Begin:
-        node_props = {"shape": "circle", "width": 0.3, "height": 0.3, "label": ""}
-    elif node_type == NodeType.End:
-        node_props = {"shape": "doublecircle", "width": 0.2, "height": 0.2, "label": ""}
-
-    return node_props
+    __slots__ = (
+        "node_type",
+        "has_children",
+        "invisible",
+        "is_async",
+        "is_gateway",
+        "gateway_settings",
+        "parent_id",
+    )
+
+    def __init__(
+        self,
+        node_type: NodeType,
+        has_children: bool = False,
+        invisible: bool = False,
+        is_async: bool = False,
+        is_gateway: bool = False,
+        gateway_settings: Optional[GatewaySettings] = None,
+        parent_id: Optional[str] = None,
+    ):
+        self.node_type = node_type
+        self.has_children = has_children
+        self.invisible = invisible
+        self.is_async = is_async
+        self.is_gateway = is_gateway
+        self.gateway_settings = gateway_settings
+        self.parent_id = parent_id
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"PlottingSettings({fields})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PlottingSettings):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+
+_DEFAULT_DOT_PROPS: Mapping[str, Any] = MappingProxyType({"shape": "box"})
+
+_DOT_PROPS_DEFINITIONS: dict[NodeType, dict[str, Any]] = {
+    NodeType.ConditionBegin: {"shape": "diamond", "style": "filled", "port": "n"},
+    NodeType.ConditionEnd: {
+        "shape": "diamond",
+        "style": "filled",
+        "port": "n",
+        "width": 0.4,
+        "height": 0.4,
+    },
+    NodeType.ParallelGatewayBegin: {
+        "shape": "diamond",
+        "width": 0.4,
+        "height": 0.4,
+        "label": "",
+    },
+    NodeType.ParallelGatewayEnd: {
+        "shape": "diamond",
+        "width": 0.4,
+        "height": 0.4,
+        "label": "",
+    },
+    NodeType.Begin: {"shape": "circle", "width": 0.3, "height": 0.3, "label": ""},
+    NodeType.End: {
+        "shape": "doublecircle",
+        "width": 0.2,
+        "height": 0.2,
+        "label": "",
+    },
+}
+
+# built once and shared by every node, callers only ever unpack them
+_DOT_PROPS: dict[NodeType, Mapping[str, Any]] = {
+    node_type: MappingProxyType(props)
+    for node_type, props in _DOT_PROPS_DEFINITIONS.items()
+}
+
+
+def dot_props(node_type: NodeType) -> Mapping[str, Any]:
+    return _DOT_PROPS.get(node_type, _DEFAULT_DOT_PROPS)
@@ -1,43 +1,59 @@
-import traceback
+import linecache
+import sys
 from inspect import Signature
+from types import TracebackType
+from typing import Optional
 
 from gloe._typing_utils import _match_types, _specify_types
 from gloe.base_transformer import BaseTransformer, TransformerException
 
+_TRANSFORM_METHOD_NAMES = frozenset(("transform", "transform_async"))
+
+
+def _format_transformer_frame(
+    exception_traceback: Optional[TracebackType], transformer_name: str
+) -> str:
+    # TODO: Make this filter condition stronger
+    # code names are interned, so matching frames are found by identity
+    frame_names = _TRANSFORM_METHOD_NAMES | {sys.intern(transformer_name)}
+
+    # walk the raw traceback, only the source line of the matching frame is read
+    matching_tb = None
+    tb = exception_traceback
+    while tb is not None:
+        if tb.tb_frame.f_code.co_name in frame_names:
+            matching_tb = tb
+        tb = tb.tb_next
+
+    if matching_tb is None:
+        return f'\n  in transformer "{transformer_name}"'
+
+    filename = matching_tb.tb_frame.f_code.co_filename
+    lineno = matching_tb.tb_lineno
+    line = linecache.getline(filename, lineno).strip()
+    return (
+        f"\n  "
+        f'File "{filename}", line {lineno},'
+        f' in transformer "{transformer_name}"\n  '
+        f"  >> {line}"
+    )
+
 
 def catch_transformer_exception(
     exception: Exception, raiser_transformer: BaseTransformer
 ) -> TransformerException:
-    transformer_name = raiser_transformer.__class__.__name__
-    tb = traceback.extract_tb(exception.__traceback__)
-
-    # TODO: Make this filter condition stronger
-    transformer_frames = [
-        frame
-        for frame in tb
-        if frame.name == transformer_name
-        or frame.name in ["transform", "transform_async"]
-    ]
-
-    if len(transformer_frames) >= 1:
-        transformer_frame = transformer_frames[-1]
-        exception_message = (
-            f"\n  "
-            f'File "{transformer_frame.filename}", line {transformer_frame.lineno},'
-            f' in transformer "{transformer_name}"\n  '
-            f"  >> {transformer_frame.line}"
-        )
+    exception_traceback = exception.__traceback__
 
-        transform_exception = TransformerException(
-            internal_exception=exception,
-            raiser_transformer=raiser_transformer,
-            message=exception_message,
-        )
-        return transform_exception
+    transformer_name = raiser_transformer.__class__.__name__
 
-    raise NotImplementedError(
-        "This exception was not raised by a transformer"
-    )  # pragma: no cover
+    # the frames are only walked if the message is ever rendered
+    return TransformerException(
+        internal_exception=exception,
+        raiser_transformer=raiser_transformer,
+        message_factory=lambda: _format_transformer_frame(
+            exception_traceback, transformer_name
+        ),
+    )
 
 
 def _diverging_signatures(
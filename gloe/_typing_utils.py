@@ -1,5 +1,8 @@
 from types import GenericAlias
-from typing import TypeVar, get_origin, _GenericAlias  # type: ignore
+from typing import Any, TypeVar, get_origin, _GenericAlias  # type: ignore
+
+_MAX_FORMATTED_ANNOTATIONS = 1024
+_formatted_annotations: dict[Any, tuple[Any, str]] = {}
 
 
 def _format_tuple(tuple_annotation: tuple, input_annotation) -> str:
@@ -27,6 +30,24 @@ def _format_generic_alias(return_annotation: GenericAlias, input_annotation) ->
 
 
 def _format_return_annotation(return_annotation, input_annotation=None) -> str:
+    try:
+        cached = _formatted_annotations.get(return_annotation)
+    except TypeError:  # unhashable annotations are formatted on every call
+        return _format_annotation(return_annotation, input_annotation)
+
+    # equal annotations are not always formatted alike, e.g. unions ignore the order
+    # of their members, so a cached string is only reused for the same object
+    if cached is not None and cached[0] is return_annotation:
+        return cached[1]
+
+    formatted = _format_annotation(return_annotation, input_annotation)
+    if len(_formatted_annotations) >= _MAX_FORMATTED_ANNOTATIONS:
+        _formatted_annotations.clear()
+    _formatted_annotations[return_annotation] = (return_annotation, formatted)
+    return formatted
+
+
+def _format_annotation(return_annotation, input_annotation) -> str:
     if isinstance(return_annotation, str):
         return return_annotation
     if isinstance(return_annotation, tuple):
@@ -1,10 +1,23 @@
 from abc import abstractmethod
+from collections import OrderedDict
+from functools import partial, wraps
 from inspect import Signature
-from typing import TypeVar, overload, cast, Callable, Generic, Optional, Any
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    TypeVar,
+    overload,
+    cast,
+    Callable,
+    Generic,
+    Optional,
+    Any,
+    Hashable,
+    Awaitable,
+)
 
-from typing_extensions import Self
+from typing_extensions import Self, TypeAlias
 
-from gloe._plotting_utils import PlottingSettings, NodeType
 from gloe._transformer_utils import catch_transformer_exception
 from gloe.base_transformer import BaseTransformer, Flow
 
@@ -24,28 +37,159 @@ _O7 = TypeVar("_O7")
 
 async def _execute_async_flow(flow: Flow, arg: Any) -> Any:
     result = arg
-    for op in flow:
-        if isinstance(op, BaseTransformer):
+    op: Any = None
+    # a single exception handler for the whole flow instead of one per transformer
+    try:
+        for op in flow:
             if isinstance(op, AsyncTransformer):
-                result = await op._safe_transform(result)
+                result = await op.transform_async(result)
             else:
-                if hasattr(op, "_safe_transform"):
-                    result = op._safe_transform(result)
-                else:
-                    raise NotImplementedError()
-        else:
-            raise NotImplementedError()
+                result = op.transform(result)
+    except Exception as exception:
+        # flows are built from transformers by composition, so a foreign step is
+        # only detected once it fails
+        if not isinstance(op, AsyncTransformer) and not (
+            isinstance(op, BaseTransformer) and hasattr(op, "transform")
+        ):
+            raise NotImplementedError() from exception
+        if not op.wrap_exceptions:
+            raise
+        raise catch_transformer_exception(exception, op).internal_exception
     return result
 
 
+if TYPE_CHECKING:
+    from asyncio import Future
+
+_ResultsCache: TypeAlias = "OrderedDict[Hashable, Future[Any]]"
+
+_DEFAULT_CACHE_SIZE = 128
+
+
+def _discard_failed(cache: _ResultsCache, key: Hashable, future: "Future[Any]"):
+    # only successful results are kept, failed keys run again on the next call
+    if future.cancelled() or future.exception() is not None:
+        if cache.get(key) is future:
+            del cache[key]
+
+
+def _cached_transform_async(
+    transform_async: Callable[[Any, Any], Awaitable[Any]]
+) -> Callable[[Any, Any], Awaitable[Any]]:
+    # only cacheable transformers need asyncio, so it is not imported with gloe
+    import asyncio
+
+    @wraps(transform_async)
+    async def cached_transform_async(self: "AsyncTransformer", data: Any) -> Any:
+        cache = self._results_cache
+        # only the outermost override is cached, calls made through super() are not
+        if cache is None or type(self).transform_async is not cached_transform_async:
+            return await transform_async(self, data)
+
+        key = self.cache_key(data)
+        try:
+            future = cache.get(key)
+        except TypeError:  # unhashable keys are never cached
+            return await transform_async(self, data)
+
+        if future is None:
+            # the cache owns the execution, so cancelling the first caller does
+            # not cancel the concurrent calls waiting for the same key
+            future = asyncio.ensure_future(transform_async(self, data))
+            future.add_done_callback(partial(_discard_failed, cache, key))
+            cache[key] = future
+            if len(cache) > cast(int, self._cache_size):
+                cache.popitem(last=False)
+            return await asyncio.shield(future)
+
+        cache.move_to_end(key)
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            # each caller wraps the error it raises, so an error is never shared
+            # with the calls that joined the failed execution, they run it again
+            return await transform_async(self, data)
+
+    setattr(cached_transform_async, "__gloe_cached__", True)
+    return cached_transform_async
+
+
 class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
+    """
+    An AsyncTransformer is the generic block with the responsibility to take an input
+    of type `T` and transform it asynchronously to an output of type `S`.
+
+    See Also:
+        Read more about this feature in the page :ref:`async-transformers`.
+
+    Example:
+        Typical usage example::
+
+            class FetchUser(AsyncTransformer[int, User]):
+                ...
+
+    """
+
+    __slots__ = ("_results_cache",)
+
+    _cache_size: ClassVar[Optional[int]] = None
+
     def __init__(self):
         super().__init__()
 
-        self._plotting_settings = PlottingSettings(
-            node_type=NodeType.Transformer, is_async=True
+        # shared by reference with the copies made while composing pipelines
+        self._results_cache: Optional[_ResultsCache] = (
+            OrderedDict() if self._cache_size is not None else None
         )
-        self.__class__.__annotations__ = self.transform_async.__annotations__
+
+        self.plotting_settings.is_async = True
+
+    def __init_subclass__(
+        cls,
+        cacheable: Optional[bool] = None,
+        cache_size: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        Subclasses can memoize their results by passing ``cacheable=True`` to the
+        class definition. The results are kept in a per-instance LRU keyed by
+        :meth:`cache_key`, and concurrent calls with the same key await a single
+        execution of :meth:`transform_async`.
+
+        Both settings are inherited, and a subclass overriding
+        :meth:`transform_async` is cached as well, unless it passes
+        ``cacheable=False``.
+
+        Args:
+            cacheable: whether the results are memoized, inherited by default.
+            cache_size: how many results each instance keeps, 128 by default.
+                Only accepted by cacheable transformers.
+
+        Example:
+            Typical usage example::
+
+                class FetchUser(
+                    AsyncTransformer[int, User], cacheable=True, cache_size=256
+                ):
+                    ...
+        """
+        super().__init_subclass__(**kwargs)
+        if cacheable is not None:
+            cls._cache_size = _DEFAULT_CACHE_SIZE if cacheable else None
+        if cache_size is not None:
+            if cls._cache_size is None:
+                raise TypeError(
+                    f"{cls.__name__} is not cacheable, so it accepts no cache_size"
+                )
+            cls._cache_size = cache_size
+
+        if cls._cache_size is not None and not hasattr(
+            cls.transform_async, "__gloe_cached__"
+        ):
+            cls.transform_async = _cached_transform_async(  # type: ignore
+                cls.transform_async
+            )
+        cls.__annotations__ = cls.transform_async.__annotations__
 
     @abstractmethod
     async def transform_async(self, data: _In) -> _Out:
@@ -60,6 +204,19 @@ class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
             The outcome data, it means, the resulf of the transformation.
         """
 
+    def cache_key(self, data: _In) -> Hashable:
+        """
+        Key under which the result of a cacheable transformer is memoized.
+
+        Args:
+            data: the incoming data passed to the transformer.
+
+        Return:
+            A hashable key, the incoming data itself by default. Unhashable keys
+            disable the cache for that call.
+        """
+        return cast(Hashable, data)
+
     def signature(self) -> Signature:
         return self._signature(AsyncTransformer, "transform_async")
 
@@ -78,24 +235,20 @@ class AsyncTransformer(Generic[_In, _Out], BaseTransformer[_In, _Out]):
         )
 
     async def _safe_transform(self, data: _In) -> _Out:
-        transform_exception = None
-
-        transformed: Optional[_Out] = None
         try:
-            transformed = await self.transform_async(data)
+            return await self.transform_async(data)
         except Exception as exception:
-            transform_exception = catch_transformer_exception(exception, self)
-
-        if transform_exception is not None:
-            raise transform_exception.internal_exception
-
-        if type(transformed) is not None:
-            return cast(_Out, transformed)
-
-        raise NotImplementedError  # pragma: no cover
+            if not self.wrap_exceptions:
+                raise
+            raise catch_transformer_exception(exception, self).internal_exception
 
     async def __call__(self, data: _In) -> _Out:
-        return await _execute_async_flow(self._flow, data)
+        flow = self._flow
+        if len(flow) > 1 or flow[0] is not self:
+            return await _execute_async_flow(flow, data)
+
+        # a lone transformer skips the flow executor
+        return await self._safe_transform(data)
 
     def copy(
         self,
@@ -1,16 +1,19 @@
-import copy
-import types
-import uuid
 import inspect
+import os
+import sys
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass
-from functools import cache
 from inspect import Signature
+from struct import iter_unpack
+from types import MethodType
+from uuid import UUID
 
 
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Generic,
     TypeVar,
     Union,
@@ -29,16 +32,8 @@ from gloe._typing_utils import _format_return_annotation
 
 __all__ = ["BaseTransformer", "TransformerException", "PreviousTransformer"]
 
-_NextOut = TypeVar("_NextOut")
 _Self = TypeVar("_Self", bound="BaseTransformer")
 
-_Out2 = TypeVar("_Out2")
-_Out3 = TypeVar("_Out3")
-_Out4 = TypeVar("_Out4")
-_Out5 = TypeVar("_Out5")
-_Out6 = TypeVar("_Out6")
-_Out7 = TypeVar("_Out7")
-
 
 PreviousTransformer: TypeAlias = Union[
     None,
@@ -53,20 +48,80 @@ PreviousTransformer: TypeAlias = Union[
 
 TransformerChildren: TypeAlias = list["BaseTransformer"]
 
+# random version 4 UUIDs are drawn from a pool filled by a single os.urandom call
+_UUID_POOL_SIZE = 256
+_UUID_VERSION_MASK = ((1 << 128) - 1) & ~((0xF000 << 64) | (0xC000 << 48))
+_UUID_VERSION_BITS = (0x4000 << 64) | (0x8000 << 48)
+_uuid_pool: list[UUID] = []
+
+if hasattr(os, "register_at_fork"):
+    # a forked process must not hand out the same ids as its parent
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _uuid4() -> UUID:
+    try:
+        return _uuid_pool.pop()
+    except IndexError:
+        random_bytes = os.urandom(16 * _UUID_POOL_SIZE)
+        for high, low in iter_unpack(">QQ", random_bytes):
+            random_int = ((high << 64) | low) & _UUID_VERSION_MASK
+            _uuid_pool.append(UUID(int=random_int | _UUID_VERSION_BITS))
+        return _uuid_pool.pop()
+
+
+# the C-level storage of BaseException.args, read by its __str__ and __repr__
+_exception_args: Any = vars(BaseException)["args"]
+
 
 class TransformerException(Exception):
+    __slots__ = (
+        "_internal_exception",
+        "raiser_transformer",
+        "_traceback",
+        "_message",
+        "_message_factory",
+    )
+
     def __init__(
         self,
         internal_exception: Union["TransformerException", Exception],
         raiser_transformer: "BaseTransformer",
         message: Union[str, None] = None,
+        message_factory: Optional[Callable[[], str]] = None,
     ):
         self._internal_exception = internal_exception
         self.raiser_transformer = raiser_transformer
         self._traceback = internal_exception.__traceback__
+        self._message = message
+        self._message_factory = message_factory
         internal_exception.__cause__ = self
         super().__init__(message)
 
+    def _resolve_message(self):
+        message_factory = self._message_factory
+        if message_factory is not None:
+            self._message_factory = None
+            self._message = message_factory()
+            _exception_args.__set__(self, (self._message,))
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        self._resolve_message()
+        return _exception_args.__get__(self)
+
+    @args.setter
+    def args(self, args: tuple[Any, ...]):
+        _exception_args.__set__(self, args)
+
+    def __str__(self) -> str:
+        self._resolve_message()
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        self._resolve_message()
+        return super().__repr__()
+
     @property
     def internal_exception(self):
         return self._internal_exception.with_traceback(self._traceback)
@@ -79,14 +134,6 @@ class GloeNode:
     output_annotation: str
     ltail: Optional[str] = None
 
-    @staticmethod
-    def from_transformer(transformer: "BaseTransformer") -> "GloeNode":
-        return GloeNode(
-            id=transformer.node_id,
-            input_annotation=transformer.input_annotation,
-            output_annotation=transformer.output_annotation,
-        )
-
 
 _In = TypeVar("_In", contravariant=True)
 _Out = TypeVar("_Out", covariant=True)
@@ -95,19 +142,109 @@ _Out = TypeVar("_Out", covariant=True)
 Flow = list["BaseTransformer"]
 
 
+class _CopyMemo(dict[int, "BaseTransformer"]):
+    """Copies made so far, by id of the original, and the ones not linked yet."""
+
+    def __init__(self, copies: dict[int, "BaseTransformer"]):
+        super().__init__(copies)
+        self.pending: list[tuple["BaseTransformer", "BaseTransformer", bool]] = []
+
+
+# handed from the outermost copy to the `copy` of a nested transformer, so the memo
+# stays out of the public `copy` signature that subclasses override
+_nested_copy_memo: ContextVar[Optional[_CopyMemo]] = ContextVar(
+    "_nested_copy_memo", default=None
+)
+
+
+def _link_copies(memo: _CopyMemo):
+    while memo.pending:
+        original, copied, regenerate_instance_id = memo.pending.pop()
+
+        def copy_node(node: "BaseTransformer") -> "BaseTransformer":
+            copied_node = memo.get(id(node))
+            if copied_node is None:
+                token = _nested_copy_memo.set(memo)
+                try:
+                    copied_node = node.copy(
+                        regenerate_instance_id=regenerate_instance_id
+                    )
+                finally:
+                    _nested_copy_memo.reset(token)
+            return copied_node
+
+        # lists already replaced by an overridden `copy` are left untouched
+        if copied._children is original._children:
+            copied._children = list(map(copy_node, original.children))
+
+        if copied._flow is original._flow:
+            # UUIDs are compared by their integer value, skipping UUID.__eq__
+            original_id = original.instance_id.int
+            copied._flow = [
+                copied if child.instance_id.int == original_id else copy_node(child)
+                for child in original._flow
+            ]
+
+
+def _declared_slots(klass: type) -> tuple[str, ...]:
+    slots = vars(klass).get("__slots__", ())
+    if isinstance(slots, str):
+        return (slots,)
+    return tuple(slots)
+
+
 class BaseTransformer(Generic[_In, _Out], ABC):
+    __slots__ = (
+        "_children",
+        "id",
+        "instance_id",
+        "is_atomic",
+        "_label",
+        "_already_copied",
+        "_plotting_settings",
+        "_flow",
+        "_node_id",
+        "_graph_cache",
+        "_hash",
+    )
+
+    # subclasses can set it to False to have their errors raised untouched, without
+    # the TransformerException cause pointing to them
+    wrap_exceptions: ClassVar[bool] = True
+
+    _signature_cache: ClassVar[dict[tuple[Any, ...], Signature]]
+    _slot_names: ClassVar[tuple[str, ...]]
+    _orig_base_args: ClassVar[tuple[tuple[Any, tuple[Any, ...]], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._signature_cache = {}
+        # the origin and arguments of the generic bases are class invariants
+        cls._orig_base_args = tuple(
+            (get_origin(base), get_args(base))
+            for base in getattr(cls, "__orig_bases__", ())
+        )
+        cls._slot_names = tuple(
+            slot_name
+            for klass in cls.__mro__
+            for slot_name in _declared_slots(klass)
+            if slot_name not in ("__dict__", "__weakref__")
+        )
+
     def __init__(self):
         self._children: TransformerChildren = []
-        self.id = uuid.uuid4()
-        self.instance_id = uuid.uuid4()
+        self.id = _uuid4()
+        # the id never changes, so its hash is computed once
+        self._hash = hash(self.id)
+        self.instance_id = _uuid4()
         self.is_atomic = False
         self._label = self.__class__.__name__
         self._already_copied = False
-        self._plotting_settings: PlottingSettings = PlottingSettings(
-            invisible=False,
-            node_type=NodeType.Transformer,
-        )
+        # built on first access, most transformers are never plotted
+        self._plotting_settings: Optional[PlottingSettings] = None
         self._flow: Flow = [self]
+        self._node_id: Optional[tuple[UUID, str]] = None
+        self._graph_cache: dict[str, GloeGraph] = {}
 
     @property
     def label(self) -> str:
@@ -135,16 +272,40 @@ class BaseTransformer(Generic[_In, _Out], ABC):
         """
         Defines how the transformer will be plotted.
         """
-        return self._plotting_settings
+        settings = self._plotting_settings
+        if settings is None:
+            settings = self._plotting_settings = PlottingSettings(
+                invisible=False,
+                node_type=NodeType.Transformer,
+            )
+        return settings
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        return self._hash
 
     def __eq__(self, other):
         if isinstance(other, BaseTransformer):
             return self.id == other.id
         raise NotImplementedError()
 
+    def _shallow_clone(self: Self) -> Self:
+        # build the copy by hand instead of going through the `copy` module protocol
+        copied: Self = object.__new__(type(self))
+        for slot_name in self._slot_names:
+            try:
+                setattr(copied, slot_name, getattr(self, slot_name))
+            except AttributeError:  # pragma: no cover
+                pass
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            copied.__dict__.update(instance_dict)
+        # the flow of a clone can be changed, so its graphs are built again
+        copied._graph_cache = {}
+        return copied
+
+    def __copy__(self: Self) -> Self:
+        return self._shallow_clone()
+
     def _copy(
         self: Self,
         transform: Optional[Callable[[Self, _In], _Out]] = None,
@@ -152,40 +313,46 @@ class BaseTransformer(Generic[_In, _Out], ABC):
         transform_method: str = "transform",
         force: bool = False,
     ) -> Self:
+        # transformers shared between branches, children and flow are copied once
+        memo = _nested_copy_memo.get()
+        is_outermost = memo is None
+        if memo is None:
+            memo = _CopyMemo({})
+        else:
+            # further copies made by an overridden `copy` are independent
+            _nested_copy_memo.set(None)
 
-        copied: Self = copy.copy(self)
+        copied = self._shallow_clone()
         copied._already_copied = True
+        memo[id(self)] = copied
 
         if transform is not None:
-            setattr(copied, transform_method, types.MethodType(transform, copied))
+            copied.__dict__[transform_method] = MethodType(transform, copied)
 
-        old_instance_id = self.instance_id
         if regenerate_instance_id:
-            copied.instance_id = uuid.uuid4()
+            copied.instance_id = _uuid4()
 
         if self._already_copied and not force:
+            old_instance_id = self.instance_id.int
             copied._flow = [
                 (
                     cast(BaseTransformer, copied)
-                    if child.instance_id == old_instance_id
+                    if child.instance_id.int == old_instance_id
                     else child
                 )
                 for child in self._flow
             ]
+        elif not self._children and len(self._flow) == 1 and self._flow[0] is self:
+            # a lone transformer without children has nothing to link
+            copied._children = []
+            copied._flow = [copied]
         else:
-            copied._children = [
-                child.copy(regenerate_instance_id=regenerate_instance_id)
-                for child in self.children
-            ]
+            # nested transformers are linked by the outermost copy with a worklist,
+            # so deeply nested pipelines do not recurse
+            memo.pending.append((self, copied, regenerate_instance_id))
 
-            copied._flow = [
-                (
-                    cast(BaseTransformer, copied)
-                    if child.instance_id == old_instance_id
-                    else child.copy(regenerate_instance_id=regenerate_instance_id)
-                )
-                for child in self._flow
-            ]
+        if is_outermost:
+            _link_copies(memo)
         return copied
 
     def copy(
@@ -201,13 +368,29 @@ class BaseTransformer(Generic[_In, _Out], ABC):
         """Transformer function-like signature"""
 
     def _signature(self, klass: Type, transform_method: str = "transform") -> Signature:
-        orig_bases = getattr(self, "__orig_bases__", [])
-        transformer_args = [
-            get_args(base) for base in orig_bases if get_origin(base) == klass
-        ]
-        generic_args = [
-            get_args(base) for base in orig_bases if get_origin(base) == Generic
-        ]
+        # a transform method rebound on the instance (see `copy`) has its own signature,
+        # kept next to the bound method it was computed for
+        instance_dict = getattr(self, "__dict__", {})
+        rebound_method = instance_dict.get(transform_method)
+        if rebound_method is not None:
+            cached = instance_dict.get("_rebound_signature")
+            if cached is not None and cached[0] is rebound_method:
+                return cached[1]
+            rebound_signature = self._compute_signature(klass, transform_method)
+            instance_dict["_rebound_signature"] = (rebound_method, rebound_signature)
+            return rebound_signature
+
+        cache_key = (klass, transform_method, getattr(self, "__orig_class__", None))
+        signature = self._signature_cache.get(cache_key)
+        if signature is None:
+            signature = self._compute_signature(klass, transform_method)
+            self._signature_cache[cache_key] = signature
+        return signature
+
+    def _compute_signature(self, klass: Type, transform_method: str) -> Signature:
+        orig_base_args = self._orig_base_args
+        transformer_args = [args for origin, args in orig_base_args if origin == klass]
+        generic_args = [args for origin, args in orig_base_args if origin == Generic]
 
         orig_class = getattr(self, "__orig_class__", None)
 
@@ -229,13 +412,17 @@ class BaseTransformer(Generic[_In, _Out], ABC):
         new_return_annotation = specific_args.get(
             signature.return_annotation, signature.return_annotation
         )
-        parameters = list(signature.parameters.values())
-        if len(parameters) > 0:
-            parameter = parameters[0]
-            parameter = parameter.replace(
-                annotation=specific_args.get(parameter.annotation, parameter.annotation)
-            )
-            parameters = [parameter]
+        # only the incoming data is part of the transformer signature
+        first = next(iter(signature.parameters.values()), None)
+        parameters = (
+            []
+            if first is None
+            else [
+                first.replace(
+                    annotation=specific_args.get(first.annotation, first.annotation)
+                )
+            ]
+        )
 
         return signature.replace(
             return_annotation=new_return_annotation,
@@ -251,21 +438,21 @@ class BaseTransformer(Generic[_In, _Out], ABC):
     def output_annotation(self) -> str:
         output_type = self.output_type
 
-        return_type = _format_return_annotation(output_type)
+        # equal annotations of different nodes share a single string
+        return_type = sys.intern(_format_return_annotation(output_type))
         return return_type
 
     @property
     def input_type(self) -> Any:
-        parameters = list(self.signature().parameters.items())
-        if len(parameters) > 0:
-            parameter_type = parameters[0][1].annotation
-            return parameter_type
+        for parameter in self.signature().parameters.values():
+            return parameter.annotation
+        return None
 
     @property
     def input_annotation(self) -> str:
         input_type = self.input_type
 
-        incoming_type = _format_return_annotation(input_type)
+        incoming_type = sys.intern(_format_return_annotation(input_type))
         return incoming_type
 
     def _add_net_node(self, net: GloeGraph, custom_data: dict[str, Any] = {}):
@@ -283,7 +470,12 @@ class BaseTransformer(Generic[_In, _Out], ABC):
 
     @property
     def node_id(self) -> str:
-        return str(self.instance_id)
+        # the string is kept with the instance id it was built from, so a copy with
+        # a regenerated instance id never reuses it
+        cached = self._node_id
+        if cached is None or cached[0] is not self.instance_id:
+            cached = self._node_id = (self.instance_id, str(self.instance_id))
+        return cached[1]
 
     def _add_subgraph(
         self,
@@ -292,7 +484,7 @@ class BaseTransformer(Generic[_In, _Out], ABC):
         current_node: "BaseTransformer",
     ) -> GloeNode:
         child_node = current_node.children[0]
-        subgraph_name = f"cluster_{current_node.instance_id}"
+        subgraph_name = f"cluster_{current_node.node_id}"
         subgraph = child_node.graph(name=subgraph_name)
         subgraph.attrs["label"] = current_node.label
         net.add_subgraph(subgraph)
@@ -320,32 +512,46 @@ class BaseTransformer(Generic[_In, _Out], ABC):
         root_node: GloeNode,
     ) -> GloeNode:
         prev_node = root_node
+        add_edge = net.add_edge
         for node in self._flow:
+            settings = node.plotting_settings
             # skip if the node is invisible
-            if node.plotting_settings.invisible:
+            if settings.invisible:
                 continue
 
             # if the node is a gateway, we need to go deeper
-            if node.plotting_settings.is_gateway:
+            if settings.is_gateway:
                 prev_node = node._dag(net, prev_node)
-            elif node.plotting_settings.has_children and len(node.children) > 0:
+            elif settings.has_children and len(node.children) > 0:
                 # if the node is not a gateway, but has children, we add its children
                 # to a subgraph
                 prev_node = self._add_subgraph(net, prev_node, node)
             else:  # otherwise, we add the node to the graph
                 node_id = node._add_net_node(net)
+                input_annotation = node.input_annotation
 
-                net.add_edge(
+                add_edge(
                     prev_node.id,
                     node_id,
-                    label=node.input_annotation,
+                    label=input_annotation,
                     ltail=prev_node.ltail,
                 )
-                prev_node = GloeNode.from_transformer(node)
+                # the annotations are formatted once per node
+                prev_node = GloeNode(
+                    id=node_id,
+                    input_annotation=input_annotation,
+                    output_annotation=node.output_annotation,
+                )
         return prev_node
 
-    @cache
     def graph(self, name: str = "") -> GloeGraph:
+        # graphs are memoized on the instance, so they are released along with it
+        net = self._graph_cache.get(name)
+        if net is None:
+            net = self._graph_cache[name] = self._build_graph(name)
+        return net
+
+    def _build_graph(self, name: str) -> GloeGraph:
         net = GloeGraph(name=name)
         net.attrs["splines"] = "ortho"
         net.add_node(f"{name}begin", _label="begin", **dot_props(NodeType.Begin))
@@ -1,6 +1,5 @@
 from typing import Generic, TypeVar, Iterable
 
-from gloe._plotting_utils import PlottingSettings, NodeType
 from gloe.transformers import Transformer
 
 _T = TypeVar("_T")
@@ -28,14 +27,9 @@ class Filter(Generic[_T], Transformer[Iterable[_T], Iterable[_T]]):
     def __init__(self, filter_transformer: Transformer[_T, bool]):
         super().__init__()
         self.filter_transformer = filter_transformer
-        self.plotting_settings.invisible = True
+        self.plotting_settings.has_children = True
         self._children = [filter_transformer]
 
-        self._plotting_settings: PlottingSettings = PlottingSettings(
-            has_children=True,
-            node_type=NodeType.Transformer,
-        )
-
     def transform(self, data: Iterable[_T]) -> Iterable[_T]:
         """
         Args:
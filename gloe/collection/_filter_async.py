@@ -1,7 +1,6 @@
 from typing import Generic, TypeVar, Iterable
 
 from gloe import AsyncTransformer
-from gloe._plotting_utils import PlottingSettings, NodeType
 
 _T = TypeVar("_T")
 
@@ -28,14 +27,9 @@ class FilterAsync(Generic[_T], AsyncTransformer[Iterable[_T], Iterable[_T]]):
     def __init__(self, filter_transformer: AsyncTransformer[_T, bool]):
         super().__init__()
         self.filter_transformer = filter_transformer
-        self.plotting_settings.invisible = True
+        self.plotting_settings.has_children = True
         self._children = [filter_transformer]
 
-        self._plotting_settings: PlottingSettings = PlottingSettings(
-            has_children=True,
-            node_type=NodeType.Transformer,
-        )
-
     async def transform_async(self, data: Iterable[_T]) -> Iterable[_T]:
         """
         Args:
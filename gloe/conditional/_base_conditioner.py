@@ -20,7 +20,7 @@ from typing import (
 from typing_extensions import Self
 
 from gloe._gloe_graph import GloeGraph
-from gloe._plotting_utils import PlottingSettings, NodeType, dot_props
+from gloe._plotting_utils import NodeType, dot_props
 from gloe.base_transformer import GloeNode
 
 
@@ -42,9 +42,9 @@ class BaseConditioner(
         super().__init__()
         self.implications = implications
         self.else_transformer = else_transformer
-        self._plotting_settings = PlottingSettings(
-            NodeType.Transformer, has_children=True, is_gateway=True
-        )
+        plotting_settings = self.plotting_settings
+        plotting_settings.has_children = True
+        plotting_settings.is_gateway = True
         self._children = [
             *[impl.then_transformer for impl in implications],
             else_transformer,
@@ -103,9 +103,10 @@ class BaseConditioner(
     ) -> GloeNode:
         in_converge_id = str(uuid.uuid4())
         label = self.__class__.__name__
+        input_annotation = self.input_annotation
         in_converge = GloeNode(
             id=in_converge_id,
-            input_annotation=self.input_annotation,
+            input_annotation=input_annotation,
             output_annotation="",
         )
 
@@ -119,7 +120,7 @@ class BaseConditioner(
         net.add_edge(
             root_node.id,
             in_converge_id,
-            label=self.input_annotation,
+            label=input_annotation,
             ltail=root_node.ltail,
         )
 
@@ -137,7 +138,7 @@ class BaseConditioner(
         )
         out_converge = GloeNode(
             id=out_converge_id,
-            input_annotation=self.input_annotation,
+            input_annotation=input_annotation,
             output_annotation="",
         )
 
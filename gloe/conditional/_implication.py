@@ -1,13 +1,9 @@
 import copy
-import sys
 from dataclasses import dataclass
 
 from typing_extensions import Self
 
 from gloe.base_transformer import BaseTransformer
-
-if sys.version_info >= (3, 10):
-    pass
 from typing import (
     Callable,
     Generic,
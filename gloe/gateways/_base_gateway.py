@@ -17,7 +17,7 @@ class _base_gateway(Generic[_In], BaseTransformer[_In, Any]):
     def __init__(self, *transformers: BaseTransformer[_In, Any]):
         super().__init__()
         self._children = list(transformers)
-        self._plotting_settings.is_gateway = True
+        self.plotting_settings.is_gateway = True
 
         input_annotations = [t.input_annotation for t in transformers]
         all_same_input = len(set(input_annotations)) == 1
@@ -49,10 +49,11 @@ class _base_gateway(Generic[_In], BaseTransformer[_In, Any]):
         return new_signature
 
     def _dag(self, net: GloeGraph, root_node: GloeNode) -> GloeNode:
+        input_annotation = self.input_annotation
         in_converge_id = str(uuid.uuid4())
         in_converge = GloeNode(
             id=in_converge_id,
-            input_annotation=self.input_annotation,
+            input_annotation=input_annotation,
             output_annotation="",
         )
         net.add_node(
@@ -76,7 +77,7 @@ class _base_gateway(Generic[_In], BaseTransformer[_In, Any]):
         out_converge_id = str(uuid.uuid4())
         out_converge = GloeNode(
             id=out_converge_id,
-            input_annotation=self.input_annotation,
+            input_annotation=input_annotation,
             output_annotation="",
         )
         net.add_node(
@@ -26,13 +26,39 @@ class _Parallel(_base_gateway[_In], Transformer[_In, tuple[Any, ...]]):
 
 class _ParallelAsync(_base_gateway[_In], AsyncTransformer[_In, tuple[Any, ...]]):
     async def transform_async(self, data: _In) -> tuple[Any, ...]:
-        results = []
-        for transformer in self._children:
+        results: list[Any] = []
+        async_indexes = []
+        for index, transformer in enumerate(self._children):
             if isinstance(transformer, AsyncTransformer):
-                result = await _execute_async_flow(transformer._flow, data)
+                async_indexes.append(index)
+                results.append(None)
             else:
-                result = _execute_flow(transformer._flow, data)
-            results.append(result)
+                results.append(_execute_flow(transformer._flow, data))
+
+        if len(async_indexes) == 1:
+            index = async_indexes[0]
+            results[index] = await _execute_async_flow(
+                self._children[index]._flow, data
+            )
+        elif len(async_indexes) > 1:
+            # async branches are awaited concurrently instead of one after another
+            import asyncio
+
+            tasks = [
+                asyncio.ensure_future(
+                    _execute_async_flow(self._children[index]._flow, data)
+                )
+                for index in async_indexes
+            ]
+            try:
+                async_results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+            for index, result in zip(async_indexes, async_results):
+                results[index] = result
+
         return tuple(results)
 
 
@@ -1,21 +1,22 @@
 from abc import ABC, abstractmethod
 from inspect import Signature
 
-from typing import TypeVar, overload, cast, Optional, Any
+from typing import TYPE_CHECKING, TypeVar, overload, Any
 from typing_extensions import TypeAlias
 
 from gloe.async_transformer import AsyncTransformer
 from gloe._transformer_utils import catch_transformer_exception
 from gloe.base_transformer import BaseTransformer, Flow
 
-from gloe._generic_types import (
-    AsyncNext2,
-    AsyncNext3,
-    AsyncNext4,
-    AsyncNext5,
-    AsyncNext6,
-    AsyncNext7,
-)
+if TYPE_CHECKING:
+    from gloe._generic_types import (
+        AsyncNext2,
+        AsyncNext3,
+        AsyncNext4,
+        AsyncNext5,
+        AsyncNext6,
+        AsyncNext7,
+    )
 
 __all__ = ["Transformer"]
 
@@ -37,11 +38,19 @@ To = TypeVar("To", bound=BaseTransformer)
 
 def _execute_flow(flow: Flow, arg: Any) -> Any:
     result = arg
-    for op in flow:
-        if isinstance(op, Transformer):
-            result = op._safe_transform(result)
-        else:
-            raise NotImplementedError()
+    op: Any = None
+    # a single exception handler for the whole flow instead of one per transformer
+    try:
+        for op in flow:
+            result = op.transform(result)
+    except Exception as exception:
+        # flows are built from transformers by composition, so a foreign step is
+        # only detected once it fails
+        if not isinstance(op, Transformer):
+            raise NotImplementedError() from exception
+        if not op.wrap_exceptions:
+            raise
+        raise catch_transformer_exception(exception, op).internal_exception
     return result
 
 
@@ -61,9 +70,11 @@ class Transformer(BaseTransformer[_I, _O], ABC):
 
     """
 
-    def __init__(self):
-        super().__init__()
-        self.__class__.__annotations__ = self.transform.__annotations__
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__annotations__ = cls.transform.__annotations__
 
     @abstractmethod
     def transform(self, data: _I) -> _O:
@@ -89,24 +100,20 @@ class Transformer(BaseTransformer[_I, _O], ABC):
         )
 
     def _safe_transform(self, data: _I) -> _O:
-        transform_exception = None
-
-        transformed: Optional[_O] = None
         try:
-            transformed = self.transform(data)
+            return self.transform(data)
         except Exception as exception:
-            transform_exception = catch_transformer_exception(exception, self)
-
-        if transform_exception is not None:
-            raise transform_exception.internal_exception
-
-        if type(transformed) is not None:
-            return cast(_O, transformed)
-
-        raise NotImplementedError()  # pragma: no cover
+            if not self.wrap_exceptions:
+                raise
+            raise catch_transformer_exception(exception, self).internal_exception
 
     def __call__(self, data: _I) -> _O:
-        return _execute_flow(self._flow, data)
+        flow = self._flow
+        if len(flow) > 1 or flow[0] is not self:
+            return _execute_flow(flow, data)
+
+        # a lone transformer skips the flow executor
+        return self._safe_transform(data)
 
     @overload
     def __rshift__(self, next_node: "Transformer[_O, O1]") -> "Transformer[_I, O1]":
@@ -179,37 +186,37 @@ class Transformer(BaseTransformer[_I, _O], ABC):
 
     @overload
     def __rshift__(
-        self, next_node: AsyncNext2[_O, O1, O2]
+        self, next_node: "AsyncNext2[_O, O1, O2]"
     ) -> AsyncTransformer[_I, tuple[O1, O2]]:
         pass
 
     @overload
     def __rshift__(
-        self, next_node: AsyncNext3[_O, O1, O2, O3]
+        self, next_node: "AsyncNext3[_O, O1, O2, O3]"
     ) -> AsyncTransformer[_I, tuple[O1, O2, O3]]:
         pass
 
     @overload
     def __rshift__(
-        self, next_node: AsyncNext4[_O, O1, O2, O3, O4]
+        self, next_node: "AsyncNext4[_O, O1, O2, O3, O4]"
     ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4]]:
         pass
 
     @overload
     def __rshift__(
-        self, next_node: AsyncNext5[_O, O1, O2, O3, O4, O5]
+        self, next_node: "AsyncNext5[_O, O1, O2, O3, O4, O5]"
     ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5]]:
         pass
 
     @overload
     def __rshift__(
-        self, next_node: AsyncNext6[_O, O1, O2, O3, O4, O5, O6]
+        self, next_node: "AsyncNext6[_O, O1, O2, O3, O4, O5, O6]"
     ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6]]:
         pass
 
     @overload
     def __rshift__(
-        self, next_node: AsyncNext7[_O, O1, O2, O3, O4, O5, O6, O7]
+        self, next_node: "AsyncNext7[_O, O1, O2, O3, O4, O5, O6, O7]"
     ) -> AsyncTransformer[_I, tuple[O1, O2, O3, O4, O5, O6, O7]]:
         pass
 
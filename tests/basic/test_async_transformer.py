@@ -146,6 +146,124 @@ class TestAsyncTransformer(unittest.IsolatedAsyncioTestCase):
         result = await pipeline(_URL)
         self.assertEqual(_DATA, result)
 
+    async def test_cacheable_async_transformer(self):
+        """
+        Test if cacheable transformers run only once per key, even concurrently
+        """
+        calls: list[str] = []
+
+        class CachedRequest(AsyncTransformer[str, str], cacheable=True, cache_size=2):
+            async def transform_async(self, url: str) -> str:
+                calls.append(url)
+                await asyncio.sleep(0.01)
+                return url + "/"
+
+        cached_request = CachedRequest()
+        pipeline = forward[str]() >> cached_request
+
+        results = await asyncio.gather(cached_request(_URL), pipeline(_URL))
+        self.assertEqual((_URL + "/", _URL + "/"), tuple(results))
+        self.assertEqual([_URL], calls)
+
+        await cached_request("a")
+        await cached_request("b")
+        await cached_request(_URL)
+        self.assertEqual([_URL, "a", "b", _URL], calls)
+        self.assertEqual("(url: str) -> str", str(cached_request.signature()))
+
+    async def test_cacheable_async_transformer_subclass(self):
+        """
+        Test if subclasses of a cacheable transformer inherit its cache settings
+        """
+        calls: list[str] = []
+
+        class CachedRequest(AsyncTransformer[str, str], cacheable=True):
+            async def transform_async(self, url: str) -> str:
+                calls.append(url)
+                return url + "/"
+
+        class TrimmedRequest(CachedRequest):
+            async def transform_async(self, url: str) -> str:
+                return (await super().transform_async(url)).strip()
+
+        class UncachedRequest(TrimmedRequest, cacheable=False):
+            pass
+
+        class SmallCachedRequest(CachedRequest, cache_size=1):
+            pass
+
+        trimmed_request = TrimmedRequest()
+        self.assertEqual(_URL + "/", await trimmed_request(" " + _URL))
+        self.assertEqual(_URL + "/", await trimmed_request(" " + _URL))
+        self.assertEqual([" " + _URL], calls)
+
+        uncached_request = UncachedRequest()
+        await uncached_request(_URL)
+        await uncached_request(_URL)
+        self.assertEqual([" " + _URL, _URL, _URL], calls)
+
+        small_cached_request = SmallCachedRequest()
+        for url in ["a", "b", "a"]:
+            await small_cached_request(url)
+        self.assertEqual([" " + _URL, _URL, _URL, "a", "b", "a"], calls)
+
+        with self.assertRaises(TypeError):
+
+            class SizedRequest(RequestData, cache_size=1):
+                pass
+
+    async def test_cacheable_async_transformer_cancelled_caller(self):
+        """
+        Test if cancelling the first call of a key does not cancel the others
+        """
+        calls: list[str] = []
+
+        class CachedRequest(AsyncTransformer[str, str], cacheable=True):
+            async def transform_async(self, url: str) -> str:
+                calls.append(url)
+                await asyncio.sleep(0.01)
+                return url + "/"
+
+        cached_request = CachedRequest()
+        first = asyncio.ensure_future(cached_request(_URL))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cached_request(_URL))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(_URL + "/", await second)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(_URL + "/", await cached_request(_URL))
+        self.assertEqual([_URL], calls)
+
+    async def test_cacheable_async_transformer_concurrent_errors(self):
+        """
+        Test if concurrent failing calls of a key raise their own errors
+        """
+
+        class CachedLn(AsyncTransformer[float, float], cacheable=True):
+            async def transform_async(self, num: float) -> float:
+                await asyncio.sleep(0.01)
+                return await async_natural_logarithm.transform_async(num)
+
+        cached_ln = CachedLn()
+        pipeline = forward[float]() >> cached_ln
+
+        results = await asyncio.gather(
+            cached_ln(-1), pipeline(-1), return_exceptions=True
+        )
+        for result in results:
+            self.assertIsInstance(result, LnOfNegativeNumber)
+        errors = cast(list[LnOfNegativeNumber], results)
+        self.assertIsNot(errors[0], errors[1])
+
+        raisers = [
+            cast(TransformerException, error.__cause__).raiser_transformer
+            for error in errors
+        ]
+        self.assertIs(cached_ln, raisers[0])
+        self.assertIs(pipeline._flow[-1], raisers[1])
+
     def test_async_transformer_wrong_signature(self):
         with self.assertWarns(RuntimeWarning):
 
@@ -204,6 +322,37 @@ class TestAsyncTransformer(unittest.IsolatedAsyncioTestCase):
             exception_ctx = cast(TransformerException, exception.__cause__)
             self.assertEqual(async_natural_logarithm, exception_ctx.raiser_transformer)
 
+    async def test_async_transformer_without_error_wrapping(self):
+        """
+        Test if async transformers opting out of the error wrapping raise errors
+        untouched
+        """
+
+        class UnwrappedLn(AsyncTransformer[float, float]):
+            wrap_exceptions = False
+
+            async def transform_async(self, num: float) -> float:
+                return await async_natural_logarithm.transform_async(num)
+
+        unwrapped_ln = UnwrappedLn()
+        self.assertEqual(await unwrapped_ln(1), 0)
+
+        for graph in [unwrapped_ln, async_plus1 >> unwrapped_ln]:
+            with self.assertRaises(LnOfNegativeNumber) as context:
+                await graph(-2)
+            self.assertIsNone(context.exception.__cause__)
+
+        class Ln(AsyncTransformer[float, float]):
+            async def transform_async(self, num: float) -> float:
+                return await async_natural_logarithm.transform_async(num)
+
+        Ln.wrap_exceptions = False
+        ln = Ln()
+        for graph in [ln, async_plus1 >> ln]:
+            with self.assertRaises(LnOfNegativeNumber) as context:
+                await graph(-2)
+            self.assertIsNone(context.exception.__cause__)
+
     async def test_execute_async_wrong_flow(self):
         flow = [2]
         with self.assertRaises(NotImplementedError):
@@ -8,6 +8,7 @@ from gloe import (
     transformer,
     Transformer,
 )
+from gloe.utils import forward
 from tests.lib.transformers import (
     square,
     square_root,
@@ -180,6 +181,30 @@ class TestTransformerBasic(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.assertEqual(square, 1)
 
+    def test_overridden_copy_inside_pipeline(self):
+        class Halve(Transformer[float, float]):
+            def transform(self, data: float) -> float:
+                return data / 2
+
+            def copy(self, transform=None, regenerate_instance_id=False, force=False):
+                return super().copy(transform, regenerate_instance_id, force)
+
+        graph = plus1 >> Halve()
+        copied = graph.copy(force=True)
+
+        self.assertEqual(copied(11), 6.0)
+        self.assertEqual(graph.copy(regenerate_instance_id=True)(11), 6.0)
+
+    def test_repeated_composition(self):
+        """
+        Test if composing the same transformers again gives a distinct pipeline
+        """
+        graph1 = square >> square_root
+        graph2 = square >> square_root
+
+        self.assertNotEqual(graph1, graph2)
+        self.assertEqual(2, len({graph1, graph2}))
+
     def test_transformer_pydoc_keeping(self):
         @transformer
         def to_string(num: int) -> str:
@@ -198,6 +223,17 @@ class TestTransformerBasic(unittest.TestCase):
 
         self.assertEqual(str(signature), "(num: float) -> float")
 
+    def test_transformer_signature_specialization(self):
+        """
+        Test if the signature of generic transformers follows their specialization
+        """
+        forward_int = forward[int]()
+        forward_str = forward[str]()
+
+        self.assertEqual(str(forward_int.signature()), "(data: int) -> int")
+        self.assertEqual(str(forward_str.signature()), "(data: str) -> str")
+        self.assertIs(forward_int.signature(), forward[int]().signature())
+
     def test_transformer_error_forward(self):
         """
         Test if an error raised inside a transformer can be caught outside it
@@ -219,6 +255,67 @@ class TestTransformerBasic(unittest.TestCase):
             exception_ctx = cast(TransformerException, exception.__cause__)
             self.assertEqual(natural_logarithm, exception_ctx.raiser_transformer)
 
+    def test_transformer_error_message(self):
+        """
+        Test if the TransformerException message points to the raiser transformer
+        """
+
+        graph = minus1 >> natural_logarithm
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            graph(-1)
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        message = str(exception_ctx)
+        self.assertIn('in transformer "natural_logarithm"', message)
+        self.assertIn("raise LnOfNegativeNumber", message)
+        self.assertIs(message, str(exception_ctx))
+
+    def test_transformer_error_args(self):
+        """
+        Test if the args and repr of a TransformerException hold its message
+        """
+
+        graph = minus1 >> natural_logarithm
+        with self.assertRaises(LnOfNegativeNumber) as context:
+            graph(-1)
+
+        exception_ctx = cast(TransformerException, context.exception.__cause__)
+        args = exception_ctx.args
+        self.assertEqual(1, len(args))
+        self.assertIn('in transformer "natural_logarithm"', args[0])
+        self.assertEqual(f"TransformerException({args[0]!r})", repr(exception_ctx))
+        self.assertEqual(args[0], str(exception_ctx))
+
+    def test_transformer_without_error_wrapping(self):
+        """
+        Test if transformers opting out of the error wrapping raise errors untouched
+        """
+
+        class UnwrappedLn(Transformer[float, float]):
+            wrap_exceptions = False
+
+            def transform(self, num: float) -> float:
+                return natural_logarithm.transform(num)
+
+        unwrapped_ln = UnwrappedLn()
+        self.assertEqual(unwrapped_ln(1), 0)
+
+        for graph in [unwrapped_ln, minus1 >> unwrapped_ln]:
+            with self.assertRaises(LnOfNegativeNumber) as context:
+                graph(-1)
+            self.assertIsNone(context.exception.__cause__)
+
+        class Ln(Transformer[float, float]):
+            def transform(self, num: float) -> float:
+                return natural_logarithm.transform(num)
+
+        ln = Ln()
+        setattr(ln, "wrap_exceptions", False)
+        for graph in [ln, minus1 >> ln]:
+            with self.assertRaises(LnOfNegativeNumber) as context:
+                graph(-1)
+            self.assertIsNone(context.exception.__cause__)
+
     def test_transformers_on_a_running_event_loop(self):
         async def run_main():
             graph = square >> square_root
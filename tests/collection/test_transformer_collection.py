@@ -1,8 +1,11 @@
 import unittest
+from typing import cast
 
+from gloe import TransformerException
 from gloe.functional import transformer
 from gloe.collection import Map, MapOver, Filter
-from tests.lib.transformers import square, plus1, sum_tuple2
+from tests.lib.exceptions import LnOfNegativeNumber
+from tests.lib.transformers import square, plus1, sum_tuple2, natural_logarithm
 
 
 class TestTransformerCollection(unittest.TestCase):
@@ -50,3 +53,19 @@ class TestTransformerCollection(unittest.TestCase):
         result = list(mapping(-1.0))
 
         self.assertListEqual(result, data)
+
+    def test_transformer_map_error_handling(self):
+        """
+        Test if an error raised by a mapped transformer is wrapped by the map
+        """
+
+        mapping = Map(natural_logarithm)
+
+        try:
+            mapping([1.0, -1.0])
+        except LnOfNegativeNumber as exception:
+            exception_ctx = cast(TransformerException, exception.__cause__)
+            self.assertEqual(mapping, exception_ctx.raiser_transformer)
+            self.assertIn('"Map"', str(exception_ctx))
+        else:
+            self.fail("LnOfNegativeNumber was not raised")
@@ -36,6 +36,19 @@ class TestTransformerEnsurer(unittest.TestCase):
         self.assertRaises(NumberIsOdd, lambda: divide_by_2(3))
         self.assertEqual(divide_by_2(2), 1)
 
+    def test_ensured_transformer_signature(self):
+        class Halve(Transformer[int, float]):
+            def transform(self, num: int) -> float:
+                return num / 2
+
+        ensured_halve = ensure(incoming=[is_even])(Halve())
+
+        signature = ensured_halve.signature()
+        self.assertIs(signature, ensured_halve.signature())
+
+        ensured_halve_copy = ensured_halve.copy(lambda _, num: num / 2)
+        self.assertIsNot(signature, ensured_halve_copy.signature())
+
     def test_output_and_changes_ensurers(self):
         @ensure(outcome=[is_greater_than_10])
         @transformer
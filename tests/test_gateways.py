@@ -1,5 +1,8 @@
+import asyncio
 import unittest
+from typing import Any
 
+from gloe import async_transformer
 from gloe.gateways import sequential, parallel
 from tests.lib.transformers import plus1, minus1, async_plus1, sum_tuple2
 
@@ -15,6 +18,16 @@ class TestGateways(unittest.TestCase):
 
         self.assertEqual((11.0, 9.0), graph(10.0))
 
+    def test_deeply_nested_gateway_copy(self):
+        graph: Any = plus1
+        for _ in range(300):
+            graph = parallel(graph, plus1)
+
+        copied = graph.copy(regenerate_instance_id=True)
+
+        self.assertNotEqual(graph.instance_id, copied.instance_id)
+        self.assertEqual(graph(1.0), copied(1.0))
+
 
 class TestAsyncGateways(unittest.IsolatedAsyncioTestCase):
     async def test_async_parallel_gateway(self):
@@ -27,3 +40,21 @@ class TestAsyncGateways(unittest.IsolatedAsyncioTestCase):
         graph = sequential(async_plus1, plus1) >> sum_tuple2
         result = await graph(10.0)
         self.assertEqual(22.0, result)
+
+    async def test_async_parallel_gateway_concurrency(self):
+        event = asyncio.Event()
+
+        @async_transformer
+        async def wait_event(num: float) -> float:
+            await asyncio.wait_for(event.wait(), timeout=1)
+            return num
+
+        @async_transformer
+        async def set_event(num: float) -> float:
+            event.set()
+            return num
+
+        graph = plus1 >> (wait_event, set_event, minus1)
+        result = await graph(10.0)
+
+        self.assertEqual((11.0, 11.0, 10.0), result)
@@ -1,4 +1,6 @@
+import gc
 import unittest
+import weakref
 from typing import Any
 from gloe import transformer, BaseTransformer
 from gloe._gloe_graph import GloeGraph
@@ -281,6 +283,18 @@ class TestTransformerGraph(unittest.TestCase):
         self._assert_nodes_count(10, graph)
         self._assert_edges_count(11, graph)
 
+    def test_graph_cache_case(self):
+        graph = plus1 >> square >> minus1
+
+        self.assertIs(graph.graph(), graph.graph())
+        self.assertIsNot(graph.graph(), graph.graph(name="other"))
+        self.assertIsNot(graph.graph(), graph.copy().graph())
+
+        graph_ref = weakref.ref(graph)
+        del graph
+        gc.collect()
+        self.assertIsNone(graph_ref())
+
     def test_partial_transformer_case(self):
         init_graph = logarithm(2) >> square
 
@@ -37,3 +37,11 @@ class TestTypeMatching(unittest.TestCase):
         self.assertEqual(_format(tuple[float, int]), "(float, int)")
         self.assertEqual(_format(Union[float, int]), "(float | int)")
         self.assertEqual(_format((float, int)), "(float, int)")
+
+    def test_format_equal_unions(self):
+        _format = _format_return_annotation
+        float_or_int, int_or_float = Union[float, int], Union[int, float]
+        self.assertEqual(float_or_int, int_or_float)
+        for _ in range(2):
+            self.assertEqual(_format(float_or_int), "(float | int)")
+            self.assertEqual(_format(int_or_float), "(int | float)")